@@ -382,6 +382,22 @@ class Config:
                     result.setdefault(tekla_class, config)
         return result
 
+    @lru_cache
+    def get_element_type_classes(self, element_type_name: str) -> list[int]:
+        """
+        Returns the tekla_classes of every element type matching the given ElementType member name.
+
+        A type matches when either name contains the other (case-insensitive). Cached because
+        select_elements_by_filter resolves the same few element types over and over.
+        """
+        key = element_type_name.replace(" ", "_").upper()
+        classes: list[int] = []
+        for types in self.element_types.values():
+            for type_name, config in types.items():
+                if key in type_name.upper() or type_name.upper() in key:
+                    classes.extend(config.get("tekla_classes", []))
+        return classes
+
     @lru_cache
     def get_custom_properties_schema(self, component_key: str) -> dict[str, dict[str, str]] | None:
         """Returns custom_properties schema for a component."""
@@ -303,6 +303,10 @@ class ElementTypes:
     Namespace for element-type class lookups backed by the config.
     """
 
+    # Inverted class mapping and the element_types dict it was built from
+    _class_mapping: dict[int, tuple[str, str]] = {}
+    _class_mapping_source: dict[str, Any] | None = None
+
     @staticmethod
     def get_class_mapping() -> dict[int, tuple[str, str]]:
         """
@@ -312,13 +316,20 @@ class ElementTypes:
         13 is both a concrete column and a reinforcement mesh), the first occurrence
         wins. element_types.json lists structural groups (concrete, steel) before
         reinforcement/embedded, so a shared class resolves to its structural type.
+
+        The mapping is built once per loaded element_types.json and reused, since
+        class lookups run per element on large selections.
         """
-        mapping: dict[int, tuple[str, str]] = {}
-        for material, types in get_config().element_types.items():
-            for type_name, config in types.items():
-                for tekla_class in config.get("tekla_classes", []):
-                    mapping.setdefault(tekla_class, (material, type_name))
-        return mapping
+        element_types = get_config().element_types
+        if element_types is not ElementTypes._class_mapping_source:
+            mapping: dict[int, tuple[str, str]] = {}
+            for material, types in element_types.items():
+                for type_name, config in types.items():
+                    for tekla_class in config.get("tekla_classes", []):
+                        mapping.setdefault(tekla_class, (material, type_name))
+            ElementTypes._class_mapping = mapping
+            ElementTypes._class_mapping_source = element_types
+        return ElementTypes._class_mapping
 
     @staticmethod
     def get_element_type_by_class(tekla_class: str | int) -> tuple[str, str]:
@@ -49,23 +49,25 @@ def _process_detail_or_component(
     *args: Any,
     **kwargs: Any,
 ) -> ToolResult:
+    selected_count = selected_objects.GetSize()
     processed_count = 0
     processed_components_count = 0
     errors: list[dict[str, Any]] = []
     for selected_object in selected_objects:
-        if isinstance(selected_object, Beam):
-            # Isolate per-object failures so one bad element (e.g. a non-concrete
-            # beam rejected by a handler) does not abort the whole batch and discard
-            # the components already inserted for earlier elements.
-            try:
-                success = callback(model, component, selected_object, *args, **kwargs)
-                if success:
-                    processed_components_count += success
-            except Exception as e:
-                guid = selected_object.Identifier.GUID.ToString()
-                logger.exception("Failed to process component on %s", guid)
-                errors.append({"guid": guid, "error": str(e)})
-            processed_count += 1
+        if not isinstance(selected_object, Beam):
+            continue
+        # Isolate per-object failures so one bad element (e.g. a non-concrete
+        # beam rejected by a handler) does not abort the whole batch and discard
+        # the components already inserted for earlier elements.
+        try:
+            success = callback(model, component, selected_object, *args, **kwargs)
+            if success:
+                processed_components_count += success
+        except Exception as e:
+            guid = selected_object.Identifier.GUID.ToString()
+            logger.exception("Failed to process component on %s", guid)
+            errors.append({"guid": guid, "error": str(e)})
+        processed_count += 1
 
     commit_success: bool | None = None
     if processed_components_count > 0:
@@ -85,7 +87,7 @@ def _process_detail_or_component(
     logger.info("Processed %s elements, %s components", processed_count, processed_components_count)
     result: dict = {
         "status": status,
-        "selected_count": selected_objects.GetSize(),
+        "selected_count": selected_count,
         "processed_count": processed_count,
         "processed_components_count": processed_components_count,
         "errors": errors,
@@ -144,7 +146,7 @@ def _process_seam_or_connection(
     logger.info("Processed %s element pairs, %s components", processed_pairs_count, processed_components_count)
     result: dict = {
         "status": status,
-        "selected_count": selected_objects.GetSize(),
+        "selected_count": count,
         "processed_pairs_count": processed_pairs_count,
         "processed_components_count": processed_components_count,
         "errors": errors,
@@ -179,9 +181,7 @@ def _put_single_component(model: TeklaModel, component: BaseComponent, selected_
 def _modify_single_component(model: TeklaModel, component: BaseComponent, selected_object: Any, *args: Any) -> int:
     counter = 0
 
-    comp_enum = selected_object.GetComponents()
-    while comp_enum.MoveNext():
-        comp = comp_enum.Current
+    for comp in selected_object.GetComponents():
         if comp.Name == component.name:
             if component.properties:
                 for key, value in component.properties.items():
@@ -258,7 +258,7 @@ def remove_components(component_name: Annotated[str, Field(description="The Tekl
     logger.info("Total components removed: %s", counter)
     result: dict = {
         "status": status,
-        "selected_count": selected_objects.GetSize(),
+        "selected_count": len(objects_list),
         "removed_components_count": counter,
     }
     if commit_success is not None:
@@ -301,10 +301,7 @@ def get_components() -> ToolResult:
         if not isinstance(selected_object.model_object, (Part, CustomPart)):
             continue
         object_components: list[dict[str, Any]] = []
-        comp_enum = selected_object.model_object.GetComponents()
-
-        while comp_enum.MoveNext():
-            comp = comp_enum.Current
+        for comp in selected_object.model_object.GetComponents():
             comp_name = comp.Name
             comp_number = comp.Number
 
@@ -22,6 +22,7 @@ from tekla_mcp_server.tekla.wrappers.model import TeklaModel
 from tekla_mcp_server.tekla.wrappers.model_object import (
     wrap_model_objects,
     wrap_model_object,
+    extents_overlap,
     TeklaAssembly,
     TeklaModelObject,
     TeklaPart,
@@ -271,16 +272,26 @@ def cut_elements_with_cutters(
     performed_cuts = 0
     cutters = list(wrap_model_objects(raw_cutters))
     used_cutter_ids: set[int] = set()
-    logger.debug("Processing %d selected objects with %d cutters (%s)", selected_objects.GetSize(), len(cutters), label)
+    selected_count = selected_objects.GetSize()
+    logger.debug("Processing %d selected objects with %d cutters (%s)", selected_count, len(cutters), label)
     if cutters:
+        # Each cutter's extents are read once and each target's once per target, so the overlap
+        # test runs on plain floats and add_cut is told to skip its own solid re-read.
+        # A target only shrinks as it is cut, so its pre-cut extents never skip a real cut
+        cutter_extents = [(cutter, cutter.get_solid_extents()) for cutter in cutters]
         for selected_object in wrap_model_objects(selected_objects):
             element_had_cut = False
-            for cutter in cutters:
+            target_extents = selected_object.get_solid_extents()
+            if target_extents is None:
+                continue
+            for cutter, extents in cutter_extents:
+                if extents is None or not extents_overlap(target_extents, extents):
+                    continue
                 # Never delete the cutter here: the same cutter may need to cut
                 # several selected targets. Deleting mid-loop would leave later
                 # targets with an invalid (deleted) cutter handle, silently
                 # skipping their cuts. Deletion is deferred until all cuts run.
-                if selected_object.add_cut(cutter, False):
+                if selected_object.add_cut(cutter, False, check_overlap=False):
                     performed_cuts += 1
                     element_had_cut = True
                     used_cutter_ids.add(cutter.id)
@@ -310,7 +321,7 @@ def cut_elements_with_cutters(
 
     result: dict = {
         "status": status,
-        "selected_count": selected_objects.GetSize(),
+        "selected_count": selected_count,
         "processed_count": processed_count,
         "performed_cuts_count": performed_cuts,
     }
@@ -463,15 +474,16 @@ def check_for_orphans(
             entry["target_guid"] = parent_assembly.guid
             orphaned.append(entry)
 
+    selected_count = selected_objects.GetSize()
     if not evaluated_guids:
-        logger.warning("No %s candidates evaluated: selection may lack geometry or contain none (elements: %d)", mode, selected_objects.GetSize())
+        logger.warning("No %s candidates evaluated: selection may lack geometry or contain none (elements: %d)", mode, selected_count)
 
-    logger.info("check_for_orphans(%s): elements=%d, evaluated=%d, orphaned=%d", mode, selected_objects.GetSize(), len(evaluated_guids), len(orphaned))
+    logger.info("check_for_orphans(%s): elements=%d, evaluated=%d, orphaned=%d", mode, selected_count, len(evaluated_guids), len(orphaned))
 
     result_content: dict = {
         "status": "warning" if orphaned else "success",
         "mode": mode,
-        "selected_count": selected_objects.GetSize(),
+        "selected_count": selected_count,
         "evaluated_count": len(evaluated_guids),
         "orphaned_count": len(orphaned),
         "orphaned": orphaned,
@@ -1039,11 +1051,12 @@ def create_report(
         time.sleep(0.5)
         timeout -= 0.5
 
-    logger.info("create_report: template=%s, elements=%d, output=%s", template_name, selected_objects.GetSize(), output_file)
+    selected_count = selected_objects.GetSize()
+    logger.info("create_report: template=%s, elements=%d, output=%s", template_name, selected_count, output_file)
 
     result: dict[str, Any] = {
         "template_name": template_name,
-        "selected_count": selected_objects.GetSize(),
+        "selected_count": selected_count,
         "file_name": report_path.name,
     }
 
@@ -191,11 +191,12 @@ def get_elements_properties(
     # GUIDs-only mode: lightweight probe, skips per-element property extraction
     if mode == "guids_only":
         guids = [obj.guid for obj in wrap_model_objects(selected_objects)]
-        logger.info("Retrieved %d GUIDs for %d selected elements", len(guids), selected_objects.GetSize())
+        selected_count = selected_objects.GetSize()
+        logger.info("Retrieved %d GUIDs for %d selected elements", len(guids), selected_count)
         return ToolResult(
             structured_content={
                 "status": "success" if guids else "warning",
-                "selected_count": selected_objects.GetSize(),
+                "selected_count": selected_count,
                 "processed_count": len(guids),
                 "guids": guids,
             }
@@ -258,24 +259,26 @@ def get_elements_properties(
     reference_objects: list[dict[str, Any]] = []
 
     for selected_object in wrap_model_objects(selected_objects):
+        # Pick the output list first, so unsupported objects (bolts, welds) skip the property reads
+        if isinstance(selected_object, TeklaReferenceModelObject):
+            target = reference_objects
+        elif isinstance(selected_object, TeklaAssembly):
+            target = flat_assemblies
+        elif isinstance(selected_object, TeklaPart):
+            target = flat_parts
+        elif isinstance(selected_object, TeklaReinforcement):
+            target = flat_reinforcements
+        else:
+            continue
+
         try:
             props = selected_object.get_properties(resolved_props if resolved_props else None)
         except Exception as e:
             extraction_errors.append({"guid": selected_object.guid, "error": str(e)})
             props = selected_object.get_properties(None)
 
-        if isinstance(selected_object, TeklaReferenceModelObject):
-            reference_objects.append(props)
-            processed_count += 1
-        elif isinstance(selected_object, TeklaAssembly):
-            flat_assemblies.append(props)
-            processed_count += 1
-        elif isinstance(selected_object, TeklaPart):
-            flat_parts.append(props)
-            processed_count += 1
-        elif isinstance(selected_object, TeklaReinforcement):
-            flat_reinforcements.append(props)
-            processed_count += 1
+        target.append(props)
+        processed_count += 1
 
     logger.info("Retrieved properties for %s elements", processed_count)
     status = "success" if flat_assemblies or flat_parts or flat_reinforcements or reference_objects else "error"
@@ -284,32 +287,36 @@ def get_elements_properties(
         if extraction_errors:
             logger.warning("Failed to extract properties for %d elements: %s", len(extraction_errors), [e.get("guid") for e in extraction_errors])
 
-    def _flatten_props(props: dict[str, Any]) -> dict[str, Any]:
-        result: dict[str, Any] = {}
+    def _column_headers(fields: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+        return tuple((field, field.replace("_", " ").title()) for field in fields)
+
+    # Headers are derived once per call rather than once per element and field
+    standard_columns = _column_headers(("position", "name", "profile", "material", "finish", "tekla_class", "part_prefix", "part_start_number", "assembly_prefix", "assembly_start_number"))
+    rebar_columns = _column_headers(("position", "name", "rebar_type", "rebar_prefix", "rebar_start_number", "tekla_class"))
+
+    def _flatten_props(props: dict[str, Any], result: dict[str, Any]) -> None:
         result["GUID"] = props.get("guid", "")
-        standard_fields = ["position", "name", "profile", "material", "finish", "tekla_class", "part_prefix", "part_start_number", "assembly_prefix", "assembly_start_number"]
-        for field in standard_fields:
+        for field, header in standard_columns:
             if field in props:
-                result[field.replace("_", " ").title()] = props[field]
+                result[header] = props[field]
         result["Phase"] = props.get("phase", "")
-        return result
 
-    def _flatten_rebar_props(props: dict[str, Any]) -> dict[str, Any]:
-        result: dict[str, Any] = {}
+    def _flatten_rebar_props(props: dict[str, Any], result: dict[str, Any]) -> None:
         result["GUID"] = props.get("guid", "")
-        for field in ["position", "name", "rebar_type", "rebar_prefix", "rebar_start_number", "tekla_class"]:
+        for field, header in rebar_columns:
             if field in props:
-                result[field.replace("_", " ").title()] = props[field]
+                result[header] = props[field]
         result["Phase"] = props.get("phase", "")
         result["Father GUID"] = props.get("father_guid") or ""
-        return result
 
     def _flatten(items: list[dict[str, Any]], row_fn=_flatten_props) -> list[dict[str, Any]]:
         if not items:
             return []
         flat_items = []
-        for i, item in enumerate(items):
-            row = row_fn(item)
+        for i, item in enumerate(items, start=1):
+            # Fill the row in place so "No" stays the first column without copying the row
+            row: dict[str, Any] = {"No": i}
+            row_fn(item, row)
             if user_props := item.get("user_properties"):
                 row.update(user_props)
             if report_props := item.get("report_properties"):
@@ -322,7 +329,7 @@ def get_elements_properties(
                         row[header] = round(value, 3) if isinstance(value, float) else value
                     else:
                         row[header] = "N/A"
-            flat_items.append({"No": i + 1, **row})
+            flat_items.append(row)
         return flat_items
 
     content_json = {
@@ -363,6 +370,7 @@ def get_elements_cut_parts() -> ToolResult:
     processed_count = 0
     parts_with_cuts: list[dict[str, Any]] = []
     total_cut_parts = 0
+    boolean_cut = BooleanPart.BooleanTypeEnum.BOOLEAN_CUT
 
     for selected_object in wrap_model_objects(selected_objects):
         if not isinstance(selected_object, TeklaPart):
@@ -371,7 +379,7 @@ def get_elements_cut_parts() -> ToolResult:
 
         cuts: list[dict[str, Any]] = []
         for boolean_part in iterate_boolean_parts(selected_object.model_object):
-            if boolean_part.Type == BooleanPart.BooleanTypeEnum.BOOLEAN_CUT:
+            if boolean_part.Type == boolean_cut:
                 cutting_part = wrap_model_object(boolean_part.OperativePart)
                 if cutting_part is None:
                     logger.warning("get_elements_cut_parts: could not wrap OperativePart for boolean on %s, skipping", selected_object.guid)
@@ -666,11 +674,12 @@ def get_elements_coordinates() -> ToolResult:
                 }
             )
 
-    logger.info("Retrieved coordinates for %d of %d elements", len(elements), selected_objects.GetSize())
+    selected_count = selected_objects.GetSize()
+    logger.info("Retrieved coordinates for %d of %d elements", len(elements), selected_count)
     return ToolResult(
         structured_content={
             "status": "success" if elements else "warning",
-            "selected_count": selected_objects.GetSize(),
+            "selected_count": selected_count,
             "processed_count": len(elements),
             "elements": elements,
         }
@@ -21,7 +21,7 @@ from tekla_mcp_server.models import (
 from tekla_mcp_server.utils import mcp_handler
 from tekla_mcp_server.tekla.wrappers.model import TeklaModel
 from tekla_mcp_server.tekla.wrappers.model_object import wrap_model_objects
-from tekla_mcp_server.tekla.filter_builder import add_filter, build_filter_group, to_filter_option
+from tekla_mcp_server.tekla.filter_builder import add_numeric_filter, build_filter_group, to_filter_option
 from tekla_mcp_server.tekla.loader import (
     ArrayList,
     BinaryFilterExpression,
@@ -54,6 +54,10 @@ STANDARD_NUMERIC_EXPRESSION_MAP = {
     "assembly_start_number": TemplateFilterExpressions.CustomNumber("ASSEMBLY_START_NUMBER"),
 }
 
+# Shared by every filter build instead of a fresh .NET expression per condition
+PART_CLASS_EXPRESSION = PartFilterExpressions.Class()
+OBJECT_TYPE_EXPRESSION = ObjectFilterExpressions.Type()
+
 
 selection_provider = LocalProvider()
 
@@ -141,7 +145,7 @@ def select_elements_by_filter(
     filter_collection.Add(
         BinaryFilterExpressionItem(
             BinaryFilterExpression(
-                ObjectFilterExpressions.Type(),
+                OBJECT_TYPE_EXPRESSION,
                 NumericOperatorType.IS_EQUAL,
                 NumericConstantFilterExpression(TeklaStructuresDatabaseTypeEnum.PART),
             )
@@ -167,22 +171,22 @@ def select_elements_by_filter(
 
     # Resolve element_type to tekla class numbers
     if element_type:
-        element_type_classes: list[int] = []
-        for material_types in get_config().element_types.values():
-            for type_name, config in material_types.items():
-                logger.debug("Checking element type '%s' against '%s', classes=%s", element_type_enum.name, type_name, config.get("tekla_classes", []))
-                if element_type_enum.name.replace(" ", "_").upper() in type_name.upper() or type_name.upper() in element_type_enum.name.upper():
-                    element_type_classes.extend(config.get("tekla_classes", []))
+        element_type_classes = get_config().get_element_type_classes(element_type_enum.name)
+        logger.debug("Element type '%s' resolved to classes %s", element_type_enum.name, element_type_classes)
+        # An empty class group would still send a filter over the whole model to Tekla
+        if not element_type_classes:
+            raise ValueError(f"Element type '{element_type_enum.value}' has no Tekla classes configured")
         type_sub = BinaryFilterExpressionCollection()
-        for cls in element_type_classes:
-            add_filter(type_sub, PartFilterExpressions.Class(), cls, NumericOperatorType.IS_EQUAL, operator=BinaryFilterOperatorType.BOOLEAN_OR)
+        # Tekla has no in-list operator, so each distinct class is one OR-ed condition
+        for cls in dict.fromkeys(element_type_classes):
+            add_numeric_filter(type_sub, PART_CLASS_EXPRESSION, cls, operator=BinaryFilterOperatorType.BOOLEAN_OR)
         filter_groups.append(type_sub)
 
     # Add explicit tekla_classes to filter
     if tekla_classes:
         type_sub = BinaryFilterExpressionCollection()
-        for cls in tekla_classes:
-            add_filter(type_sub, PartFilterExpressions.Class(), cls, NumericOperatorType.IS_EQUAL, operator=BinaryFilterOperatorType.BOOLEAN_OR)
+        for cls in dict.fromkeys(tekla_classes):
+            add_numeric_filter(type_sub, PART_CLASS_EXPRESSION, cls, operator=BinaryFilterOperatorType.BOOLEAN_OR)
         filter_groups.append(type_sub)
 
     # Add standard string filters (name, profile, material, finish, phase, part_prefix, assembly_prefix)
@@ -306,11 +310,12 @@ def select_elements_by_filter_name(
     model = TeklaModel()
     objects_to_select = model.get_objects_by_filter(filter_name)
     TeklaModel.select_objects(objects_to_select)
-    logger.info("Selected %s elements by named filter", objects_to_select.GetSize())
+    selected_count = objects_to_select.GetSize()
+    logger.info("Selected %s elements by named filter", selected_count)
     return ToolResult(
         structured_content={
-            "status": "success" if objects_to_select.GetSize() else "warning",
-            "selected_count": objects_to_select.GetSize(),
+            "status": "success" if selected_count else "warning",
+            "selected_count": selected_count,
         }
     )
 
@@ -324,7 +329,8 @@ def select_elements_by_guid(
     Selects elements by their GUID.
     """
     model = TeklaModel()
-    objects_to_select = ArrayList()
+    # Preallocate so large GUID batches do not regrow the .NET list
+    objects_to_select = ArrayList(len(guids))
     selected_guids: list[str] = []
     missing_guids: list[str] = []
 
@@ -364,7 +370,13 @@ def select_elements_assemblies_or_main_parts(
     processed_count = 0
     selected_object_types = "selected_assemblies" if mode == "Assembly" else "selected_main_parts"
 
-    filtered_parts = ArrayList()
+    # Collected Python-side and handed to select_objects in one go, so the count is a len()
+    # rather than a .NET Count read
+    filtered_parts: list[Any] = []
+    # Parts of the same assembly resolve to one entry, so Tekla is not handed duplicates.
+    # An assembly without a main part is skipped for all of its parts, not just the first
+    seen_assembly_ids: set[int] = set()
+    skipped_assembly_ids: set[int] = set()
     for selected_object in wrap_model_objects(selected_objects):
         try:
             assembly = selected_object.get_top_level_assembly()
@@ -374,23 +386,29 @@ def select_elements_assemblies_or_main_parts(
         if assembly is None:
             logger.debug("No top-level assembly for %s, skipping", selected_object.guid)
             continue
-        if mode == "Assembly":
-            filtered_parts.Add(assembly.model_object)
-        elif mode == "Main Part":
-            try:
-                filtered_parts.Add(assembly.main_part.model_object)
-            except ValueError:
-                logger.warning("Assembly %s has no main part, skipping", assembly.guid)
-                continue
+        assembly_id = assembly.id
+        if assembly_id in skipped_assembly_ids:
+            continue
+        if assembly_id not in seen_assembly_ids:
+            if mode == "Assembly":
+                filtered_parts.append(assembly.model_object)
+            elif mode == "Main Part":
+                try:
+                    filtered_parts.append(assembly.main_part.model_object)
+                except ValueError:
+                    logger.warning("Assembly %s has no main part, skipping", assembly.guid)
+                    skipped_assembly_ids.add(assembly_id)
+                    continue
+            seen_assembly_ids.add(assembly_id)
         processed_count += 1
 
     TeklaModel.select_objects(filtered_parts)
-    logger.info("Selected %s elements as '%s'", filtered_parts.Count, mode)
+    logger.info("Selected %s elements as '%s'", len(filtered_parts), mode)
     return ToolResult(
         structured_content={
-            "status": "success" if filtered_parts.Count else "warning",
+            "status": "success" if filtered_parts else "warning",
             "selected_count": selected_objects.GetSize(),
             "processed_count": processed_count,
-            f"{selected_object_types}_count": filtered_parts.Count,
+            f"{selected_object_types}_count": len(filtered_parts),
         }
     )
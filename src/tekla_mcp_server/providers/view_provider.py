@@ -4,6 +4,7 @@ View tools provider for Tekla MCP server.
 Uses LocalProvider for modular organization and callable decorator pattern.
 """
 
+from collections.abc import Callable
 from typing import Annotated
 
 from fastmcp.server.providers import LocalProvider
@@ -34,6 +35,28 @@ from tekla_mcp_server.tekla.loader import (
 view_provider = LocalProvider()
 
 
+# Label getters per element type. Only the requested getter runs, since every
+# accessor is a separate .NET call and assembly weight walks all children
+ASSEMBLY_LABEL_GETTERS: dict[ElementLabel, Callable[[TeklaAssembly], str]] = {
+    ElementLabel.POSITION: lambda obj: obj.position,
+    ElementLabel.GUID: lambda obj: obj.guid,
+    ElementLabel.NAME: lambda obj: obj.name,
+    ElementLabel.PHASE: lambda obj: str(obj.phase),
+    ElementLabel.WEIGHT: lambda obj: f"{obj.weight[0]:.1f} kg",
+}
+PART_LABEL_GETTERS: dict[ElementLabel, Callable[[TeklaPart], str]] = {
+    ElementLabel.POSITION: lambda obj: obj.position,
+    ElementLabel.GUID: lambda obj: obj.guid,
+    ElementLabel.NAME: lambda obj: obj.name,
+    ElementLabel.PROFILE: lambda obj: obj.profile,
+    ElementLabel.MATERIAL: lambda obj: obj.material,
+    ElementLabel.FINISH: lambda obj: obj.finish,
+    ElementLabel.CLASS: lambda obj: str(obj.tekla_class),
+    ElementLabel.PHASE: lambda obj: str(obj.phase),
+    ElementLabel.WEIGHT: lambda obj: f"{obj.weight[0]:.1f} kg",
+}
+
+
 @view_provider.tool(tags={"view"}, annotations={"readOnlyHint": True, "destructiveHint": False})
 @mcp_handler(scope="tool")
 def draw_elements_labels(
@@ -84,7 +107,12 @@ def draw_elements_labels(
             custom_property = TemplateAttributeParser.get_attribute(resolved_label)
             unit = f" {custom_property.unit}" if custom_property.unit else ""
 
-    color_black = (0.0, 0.0, 0.0)
+    # The label never changes within a call, so resolve the getters and the color once
+    assembly_getter = ASSEMBLY_LABEL_GETTERS.get(label_enum, ASSEMBLY_LABEL_GETTERS[ElementLabel.NAME])
+    part_getter = PART_LABEL_GETTERS.get(label_enum, PART_LABEL_GETTERS[ElementLabel.NAME])
+    color_black = Color(0.0, 0.0, 0.0)
+    # The resolved label may itself be a COG coordinate, so it is only requested once
+    custom_read_names = list(dict.fromkeys([resolved_label, "COG_X", "COG_Y", "COG_Z"])) if resolved_label else []
     drawer = GraphicsDrawer()
     processed_count = 0
     drawn_labels_count = 0
@@ -92,34 +120,19 @@ def draw_elements_labels(
     for selected_object in wrap_model_objects(selected_objects):
         try:
             if label_enum == ElementLabel.CUSTOM:
-                value = selected_object.get_report_property(resolved_label)
-                text = f"{resolved_label} = {value}{unit}"
+                # The custom property and the COG come from one batched report read
+                values = selected_object.get_required_report_properties(custom_read_names)
+                text = f"{resolved_label} = {values[resolved_label]}{unit}"
+                cog = Point(values["COG_X"], values["COG_Y"], values["COG_Z"])
             else:
                 if isinstance(selected_object, TeklaAssembly):
-                    assembly_labels = {
-                        ElementLabel.POSITION: selected_object.position,
-                        ElementLabel.GUID: selected_object.guid,
-                        ElementLabel.NAME: selected_object.name,
-                        ElementLabel.PHASE: str(selected_object.phase),
-                        ElementLabel.WEIGHT: f"{selected_object.weight[0]:.1f} kg",
-                    }
-                    text = assembly_labels.get(label_enum, selected_object.name)
+                    text = assembly_getter(selected_object)
                 elif isinstance(selected_object, TeklaPart):
-                    part_labels = {
-                        ElementLabel.POSITION: selected_object.position,
-                        ElementLabel.GUID: selected_object.guid,
-                        ElementLabel.NAME: selected_object.name,
-                        ElementLabel.PROFILE: selected_object.profile,
-                        ElementLabel.MATERIAL: selected_object.material,
-                        ElementLabel.FINISH: selected_object.finish,
-                        ElementLabel.CLASS: str(selected_object.tekla_class),
-                        ElementLabel.PHASE: str(selected_object.phase),
-                        ElementLabel.WEIGHT: f"{selected_object.weight[0]:.1f} kg",
-                    }
-                    text = part_labels.get(label_enum, selected_object.name)
+                    text = part_getter(selected_object)
                 else:
                     continue
-            if drawer.DrawText(selected_object.cog, text, Color(*color_black)):
+                cog = selected_object.cog
+            if drawer.DrawText(cog, text, color_black):
                 drawn_labels_count += 1
             processed_count += 1
         except Exception as e:
@@ -146,10 +159,9 @@ def zoom_to_selection() -> ToolResult:
     tekla_model = TeklaModel()
     selected_objects = tekla_model.get_selected_objects()
 
-    processed_count = 0
-
-    min_x = min_y = min_z = float("inf")
-    max_x = max_y = max_z = float("-inf")
+    # Corners are collected first and reduced per axis once, in C, after the loop
+    min_corners: list[tuple[float, float, float]] = []
+    max_corners: list[tuple[float, float, float]] = []
 
     for selected_object in selected_objects:
         part = None
@@ -166,23 +178,17 @@ def zoom_to_selection() -> ToolResult:
 
         sp = solid.MinimumPoint
         ep = solid.MaximumPoint
+        min_corners.append((sp.X, sp.Y, sp.Z))
+        max_corners.append((ep.X, ep.Y, ep.Z))
 
-        min_x = min(min_x, sp.X)
-        min_y = min(min_y, sp.Y)
-        min_z = min(min_z, sp.Z)
-        max_x = max(max_x, ep.X)
-        max_y = max(max_y, ep.Y)
-        max_z = max(max_z, ep.Z)
-
-        processed_count += 1
-
+    processed_count = len(min_corners)
     if processed_count == 0:
         logger.warning("zoom_to_selection: no parts or assemblies in selection")
         status = "warning"
         extra: dict = {"message": "No parts or assemblies in selection to zoom to"}
     else:
-        min_point = Point(min_x, min_y, min_z)
-        max_point = Point(max_x, max_y, max_z)
+        min_point = Point(*map(min, zip(*min_corners)))
+        max_point = Point(*map(max, zip(*max_corners)))
         bbox = AABB(min_point, max_point)
         zoom_result = ViewHandler.ZoomToBoundingBox(bbox)
         logger.info("Zoomed to bounding box: %s", bbox)
@@ -15,11 +15,14 @@ from tekla_mcp_server.utils import log_function_call
 
 if TYPE_CHECKING:
     from tekla_mcp_server.models import BaseComponent
-    from tekla_mcp_server.tekla.loader import BooleanPart, ModelObject
+    from tekla_mcp_server.tekla.loader import BooleanPart, ModelObject, Solid
 
 
 HANDLERS: dict[str, type] = {}
 
+# Recess profiles are named PRMD<length>, e.g. PRMD120
+PRMD_PROFILE_PATTERN = re.compile(r"PRMD(\d+)")
+
 
 def register_handler(cls: type) -> type:
     """Decorator to register a handler class."""
@@ -129,7 +132,7 @@ class LiftingAnchorsHandler:
             Context dict with processing data (number_of_anchors, etc.)
         """
         from tekla_mcp_server.models import ElementTypes
-        from tekla_mcp_server.tekla.loader import Solid, TransformationPlane
+        from tekla_mcp_server.tekla.loader import Point, Solid, TransformationPlane
         from tekla_mcp_server.tekla.wrappers.model_object import wrap_model_object
 
         weight_factor = 1.05
@@ -143,25 +146,31 @@ class LiftingAnchorsHandler:
         if assembly is None:
             raise ValueError(f"Could not wrap assembly for selected object '{selected_object.Identifier.ID}'.")
         solid = selected_object.GetSolid(Solid.SolidCreationTypeEnum.RAW)
-        length = abs(solid.MaximumPoint.X - solid.MinimumPoint.X)
-        width = abs(solid.MaximumPoint.Z - solid.MinimumPoint.Z)
+        min_point, max_point = solid.MinimumPoint, solid.MaximumPoint
+        length = abs(max_point.X - min_point.X)
+        width = abs(max_point.Z - min_point.Z)
+
+        # Weight and COG share one batched report read instead of a separate WEIGHT read
+        assembly_values = assembly.get_required_report_properties(["WEIGHT", "COG_X", "COG_Y", "COG_Z"])
 
-        total_weight = float(assembly.get_report_property("WEIGHT")) * weight_factor
+        total_weight = float(assembly_values["WEIGHT"]) * weight_factor
         logger.debug("Assuming total weight: %s kg", total_weight)
 
         number_of_anchors, valid_anchors = self.get_required_anchors(element_type, total_weight)
 
-        first_anchor_key = next(iter(valid_anchors))
-        first_anchor_attributes = valid_anchors[first_anchor_key]["attributes"]
+        first_anchor_key, first_anchor = next(iter(valid_anchors.items()))
+        first_anchor_attributes = first_anchor["attributes"]
         logger.info("Number of anchors required: %s. Selected anchor type: %s", number_of_anchors, first_anchor_key)
 
         local_plane = TransformationPlane(selected_object.GetCoordinateSystem())
-        local_cog = local_plane.TransformationMatrixToLocal.Transform(assembly.cog)
+        local_cog = local_plane.TransformationMatrixToLocal.Transform(Point(assembly_values["COG_X"], assembly_values["COG_Y"], assembly_values["COG_Z"]))
 
-        min_edge_distance = valid_anchors[first_anchor_key]["min_edge_distance"]
+        min_edge_distance = first_anchor["min_edge_distance"]
         distance_from_start, distance_from_end, double_anchor_spacing = self.calculate_anchor_placement(min_edge_distance, length, local_cog.X, number_of_anchors)
         logger.info("Anchor placement calculated: start=%s, end=%s, spacing=%s", distance_from_start, distance_from_end, double_anchor_spacing)
 
+        # Built once per element and owned by the component, so post_process updates it in place
+        # The anchor attributes are spread rather than reused because they belong to the handler config
         properties = {
             "DistanceFrom": 1,
             "DistFromPartStart": distance_from_start,
@@ -183,6 +192,8 @@ class LiftingAnchorsHandler:
             "double_anchor_spacing": double_anchor_spacing,
             "local_cog": local_cog,
             "selected_object": selected_object,
+            # Inserting the anchors only adds cuts, which the RAW solid ignores, so post_process can reuse it
+            "raw_solid": solid,
         }
 
         return self._context
@@ -213,6 +224,7 @@ class LiftingAnchorsHandler:
         distance_from_end = context.get("distance_from_end", 0)
         double_anchor_spacing = context.get("double_anchor_spacing", 0)
         local_cog = context.get("local_cog")
+        raw_solid = context.get("raw_solid")
 
         counter = initial_count
 
@@ -225,7 +237,7 @@ class LiftingAnchorsHandler:
             counter += int(insert_component(selected_object, component))
             logger.debug("Inserted additional anchors for 4-anchor configuration. Total: %s", counter)
 
-        self._process_recesses(selected_object, local_cog)
+        self._process_recesses(selected_object, local_cog, raw_solid)
         logger.info("Total lifting anchor components inserted: %s", counter)
 
         return counter
@@ -243,9 +255,10 @@ class LiftingAnchorsHandler:
         from tekla_mcp_server.tekla.loader import BooleanPart
 
         counter = 0
+        boolean_cut = BooleanPart.BooleanTypeEnum.BOOLEAN_CUT
         for selected_object in selected_objects:
             for boolean_part in self._iterate_boolean_parts(selected_object):
-                if boolean_part.Type == BooleanPart.BooleanTypeEnum.BOOLEAN_CUT and boolean_part.OperativePart.Name == "LIFTING_ANCHOR_RECESS":
+                if boolean_part.Type == boolean_cut and boolean_part.OperativePart.Name == "LIFTING_ANCHOR_RECESS":
                     if boolean_part.Delete():
                         counter += 1
         logger.debug("Total lifting anchor recess boolean cuts removed: %s", counter)
@@ -255,10 +268,15 @@ class LiftingAnchorsHandler:
         """Iterates through boolean parts of an object."""
         from tekla_mcp_server.tekla.utils import iterate_boolean_parts
 
-        return list(iterate_boolean_parts(selected_object))
+        return iterate_boolean_parts(selected_object)
+
+    def _process_recesses(self, selected_object: "ModelObject", local_cog: Any, solid: "Solid | None" = None) -> None:
+        """
+        Creates boolean cuts for lifting anchor recesses.
 
-    def _process_recesses(self, selected_object: "ModelObject", local_cog: Any) -> None:
-        """Creates boolean cuts for lifting anchor recesses."""
+        `solid` is the RAW solid of `selected_object` when the caller already has it, otherwise
+        it is fetched on the first recess.
+        """
         from tekla_mcp_server.tekla.loader import BooleanPart, Solid
 
         default_offset = 0.0
@@ -266,38 +284,58 @@ class LiftingAnchorsHandler:
         min_ledge_height = 100.0
         magic_offset = 0.99
 
+        boolean_cut = BooleanPart.BooleanTypeEnum.BOOLEAN_CUT
+        # The RAW solid ignores boolean cuts, so the recesses added below do not change it
+        # and its extent (min Z, max Z, max Y) is read once and shared by all of them
+        solid_extent: tuple[float, float, float] | None = None
+
+        # Cheapest checks first, so the OperativePart and profile reads only happen for candidates
         for boolean_part in self._iterate_boolean_parts(selected_object):
+            if boolean_part.Type != boolean_cut:
+                continue
             operative_part = boolean_part.OperativePart
+            if operative_part.Class != "0" or operative_part.Name != "":
+                continue
+            profile_string = operative_part.Profile.ProfileString
+            if not profile_string.startswith("PRMD"):
+                continue
 
-            if boolean_part.Type == BooleanPart.BooleanTypeEnum.BOOLEAN_CUT and operative_part.Class == "0" and operative_part.Name == "" and operative_part.Profile.ProfileString.startswith("PRMD"):
-                solid = selected_object.GetSolid(Solid.SolidCreationTypeEnum.RAW)
-                ledge_height = solid.MaximumPoint.Y - operative_part.StartPoint.Y
-                if ledge_height > min_ledge_height:
-                    self._create_boolean_cut(selected_object, operative_part.StartPoint.X, operative_part.StartPoint.Y, ledge_height, default_offset, default_cut_length)
-                elif ledge_height:
-                    match = re.search(r"PRMD(\d+)", operative_part.Profile.ProfileString)
-                    if match:
-                        cut_length = float(match.group(1)) + magic_offset
-                        self._create_boolean_cut(selected_object, operative_part.StartPoint.X, operative_part.StartPoint.Y, ledge_height, default_offset, cut_length)
+            # Each property read crosses into .NET, so read the start point once
+            start_point = operative_part.StartPoint
+            if solid_extent is None:
+                if solid is None:
+                    solid = selected_object.GetSolid(Solid.SolidCreationTypeEnum.RAW)
+                min_point, max_point = solid.MinimumPoint, solid.MaximumPoint
+                solid_extent = (min_point.Z, max_point.Z, max_point.Y)
+            z_min, z_max, top_y = solid_extent
+            ledge_height = top_y - start_point.Y
+            if ledge_height > min_ledge_height:
+                self._create_boolean_cut(selected_object, z_min, z_max, start_point.X, start_point.Y, ledge_height, default_offset, default_cut_length)
+            elif ledge_height:
+                match = PRMD_PROFILE_PATTERN.match(profile_string)
+                if match:
+                    cut_length = float(match.group(1)) + magic_offset
+                    self._create_boolean_cut(selected_object, z_min, z_max, start_point.X, start_point.Y, ledge_height, default_offset, cut_length)
 
     def _create_boolean_cut(
         self,
         selected_object: "ModelObject",
+        z_min: float,
+        z_max: float,
         x_position: float,
         y_position: float,
         cut_height: float,
         depth_offset: float,
         cut_length: float,
     ) -> bool:
-        """Creates a boolean cut on the selected object."""
-        from tekla_mcp_server.tekla.loader import Beam, Point, Position, Solid
+        """Creates a boolean cut on the selected object, spanning `z_min`..`z_max` (the Z extent of its RAW solid)."""
+        from tekla_mcp_server.tekla.loader import Beam, Point, Position
         from tekla_mcp_server.tekla.wrappers.model_object import wrap_model_object
 
         z_offset = 25.0
         logger.debug("Creating boolean cut at X=%s, Y=%s, height=%s, length=%s", x_position, y_position, cut_height, cut_length)
-        solid = selected_object.GetSolid(Solid.SolidCreationTypeEnum.RAW)
-        cut_start = Point(x_position, y_position, solid.MinimumPoint.Z - z_offset)
-        cut_end = Point(x_position, y_position, solid.MaximumPoint.Z + z_offset)
+        cut_start = Point(x_position, y_position, z_min - z_offset)
+        cut_end = Point(x_position, y_position, z_max + z_offset)
 
         cutting_part = Beam()
         cutting_part.Class = "0"
@@ -336,6 +374,9 @@ class LiftingAnchorsHandler:
 
         if anchor_types is None:
             anchor_types = self.anchor_types
+        # Type and active flags do not depend on the anchor count, so they are filtered once
+        candidates = [(key, value) for key, value in anchor_types.items() if element_type in value["element_type"] and value["active"]]
+
         valid_anchors = None
         n = 2
         while n <= 4:
@@ -343,7 +384,7 @@ class LiftingAnchorsHandler:
 
             required_capacity += required_capacity * self.safety_margin / percent
 
-            valid_anchors = {key: value for key, value in anchor_types.items() if value["capacity"] >= required_capacity and element_type in value["element_type"] and value["active"]}
+            valid_anchors = {key: value for key, value in candidates if value["capacity"] >= required_capacity}
 
             if valid_anchors:
                 logger.debug("Found valid anchors for n=%s: %s", n, list(valid_anchors.keys()))
@@ -107,24 +107,69 @@ def add_filter(
             pass
 
     if isinstance(value, str):
-        if match_type is None:
-            match_type = StringMatchType.IS_EQUAL
-        op = STRING_MATCH_TYPE_MAPPING.get(match_type)
-        if op is None:
-            raise TypeError(f"Match type '{match_type}' has no string operator, so it cannot be applied to the string value {value!r}")
-        expr = BinaryFilterExpression(filter_expression, op, StringConstantFilterExpression(value))
+        add_string_filter(filter_collection, filter_expression, value, StringMatchType.IS_EQUAL if match_type is None else match_type, operator)
     else:
         # int or float - the guard at the top has already excluded everything else
-        if match_type is None:
-            match_type = NumericOperatorType.IS_EQUAL
-        if isinstance(match_type, NumericOperatorType):
-            op = match_type
-        else:
-            op = NUMERIC_MATCH_TYPE_MAPPING.get(match_type)
-        if op is None:
-            raise TypeError(f"Match type '{match_type}' has no numeric operator, so it cannot be applied to the numeric value {value!r}")
-        expr = BinaryFilterExpression(filter_expression, op, NumericConstantFilterExpression(value))
+        add_numeric_filter(filter_collection, filter_expression, value, NumericOperatorType.IS_EQUAL if match_type is None else match_type, operator)
+
+
+def add_string_filter(
+    filter_collection: BinaryFilterExpressionCollection,
+    filter_expression: Any,
+    value: str,
+    match_type: StringMatchType = StringMatchType.IS_EQUAL,
+    operator: BinaryFilterOperatorType = BinaryFilterOperatorType.BOOLEAN_AND,
+) -> None:
+    """
+    Append a string comparison to a Tekla filter collection.
+
+    Use instead of `add_filter` when the value is known to be a string, which skips
+    the type dispatch and numeric coercion.
 
+    Args:
+        filter_collection: Collection to append to (mutated in place).
+        filter_expression: Left-hand-side expression (e.g. `PartFilterExpressions.Name()`).
+        value: String to compare against.
+        match_type: Comparison operator.
+        operator: Boolean operator joining this item with previous entries.
+
+    Raises:
+        TypeError: If `match_type` has no string operator.
+    """
+    op = STRING_MATCH_TYPE_MAPPING.get(match_type)
+    if op is None:
+        raise TypeError(f"Match type '{match_type}' has no string operator, so it cannot be applied to the string value {value!r}")
+    expr = BinaryFilterExpression(filter_expression, op, StringConstantFilterExpression(value))
+    filter_collection.Add(BinaryFilterExpressionItem(expr, operator))
+
+
+def add_numeric_filter(
+    filter_collection: BinaryFilterExpressionCollection,
+    filter_expression: Any,
+    value: int | float,
+    match_type: NumericMatchType | NumericOperatorType = NumericOperatorType.IS_EQUAL,
+    operator: BinaryFilterOperatorType = BinaryFilterOperatorType.BOOLEAN_AND,
+) -> None:
+    """
+    Append a numeric comparison to a Tekla filter collection.
+
+    Use instead of `add_filter` when the value is known to be an int or float, which
+    skips the type dispatch and string-to-number coercion.
+
+    Args:
+        filter_collection: Collection to append to (mutated in place).
+        filter_expression: Left-hand-side expression (e.g. `PartFilterExpressions.Class()`).
+        value: Number to compare against.
+        match_type: Comparison operator, either a `NumericMatchType` or a Tekla `NumericOperatorType`.
+        operator: Boolean operator joining this item with previous entries.
+
+    Raises:
+        TypeError: If `match_type` has no numeric operator.
+    """
+    op = match_type if isinstance(match_type, NumericOperatorType) else NUMERIC_MATCH_TYPE_MAPPING.get(match_type)
+    if op is None:
+        raise TypeError(f"Match type '{match_type}' has no numeric operator, so it cannot be applied to the numeric value {value!r}")
+    expr = BinaryFilterExpression(filter_expression, op, NumericConstantFilterExpression(value))
     filter_collection.Add(BinaryFilterExpressionItem(expr, operator))
 
 
@@ -151,11 +196,12 @@ def build_filter_group(expression: Any, filter_option: StringFilterOption | Nume
     if not conditions:
         return None
     operator = BinaryFilterOperatorType.BOOLEAN_OR if logic == "OR" else BinaryFilterOperatorType.BOOLEAN_AND
+    # The Pydantic models already fix the value type, so skip add_filter's dispatch
     for cond in conditions:
-        value = cond.value
-        match_type_str = cond.match_type
-        match_type = NumericMatchType(match_type_str) if is_numeric else StringMatchType(match_type_str)
-        add_filter(sub, expression, value, match_type, operator=operator)
+        if is_numeric:
+            add_numeric_filter(sub, expression, cond.value, NumericMatchType(cond.match_type), operator)
+        else:
+            add_string_filter(sub, expression, cond.value, StringMatchType(cond.match_type), operator)
 
     if sub.Count == 0:
         return None
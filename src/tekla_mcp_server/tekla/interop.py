@@ -11,15 +11,25 @@ wrapper modules can use it without creating unnecessary dependencies.
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Sized
 from typing import Any
 
 from tekla_mcp_server.tekla.loader import ArrayList
 
 
-def to_array_list(objects: Iterable[Any]) -> ArrayList:
-    """Convert a Python iterable to a .NET ArrayList."""
-    array_list = ArrayList()
+def to_array_list(objects: Iterable[Any], capacity: int | None = None) -> ArrayList:
+    """
+    Convert a Python iterable to a .NET ArrayList.
+
+    Args:
+        objects: Items to copy into the list
+        capacity: Initial capacity for inputs that are not `Sized` but know their length,
+            e.g. `ModelObjectEnumerator.GetSize()`
+    """
+    # Sized inputs (lists, tuples, .NET collections) get their capacity up front, so Add never regrows
+    if capacity is None and isinstance(objects, Sized):
+        capacity = len(objects)
+    array_list = ArrayList(capacity) if capacity is not None else ArrayList()
     for obj in objects:
         array_list.Add(obj)
     return array_list
@@ -2,6 +2,7 @@
 SnapshotBuilder extracts snapshot data from Tekla objects.
 """
 
+from operator import attrgetter, itemgetter
 from typing import Any
 
 from tekla_mcp_server.config import get_config
@@ -18,7 +19,12 @@ from tekla_mcp_server.tekla.loader import (
 
 
 class SnapshotBuilder:
-    """Stateless builder that extracts snapshot data from Tekla objects."""
+    """
+    Stateless builder that extracts snapshot data from Tekla objects.
+
+    Snapshots are created with `model_construct`: every field is produced here from typed wrapper
+    properties, so re-validating them (and copying each property dict) per element is wasted work.
+    """
 
     @staticmethod
     def build_part_snapshot(part: Any) -> PartSnapshot:
@@ -28,7 +34,7 @@ class SnapshotBuilder:
         reinforcements = SnapshotBuilder._build_reinforcements(part)
         welds = SnapshotBuilder._build_welds(part)
 
-        return PartSnapshot(
+        return PartSnapshot.model_construct(
             guid=part.guid,
             id=part.id,
             pos=part.position,
@@ -58,15 +64,15 @@ class SnapshotBuilder:
         for secondary in wrap_model_objects(assembly.model_object.GetSecondaries()):
             if isinstance(secondary, TeklaPart):
                 secondaries.append(secondary.to_snapshot())
-        secondaries = sorted(secondaries, key=lambda s: (s.id, s.pos))
+        secondaries.sort(key=attrgetter("id", "pos"))
 
         subassemblies = []
         for subassembly in wrap_model_objects(assembly.model_object.GetSubAssemblies()):
             if isinstance(subassembly, TeklaAssembly):
                 subassemblies.append(subassembly.to_snapshot())
-        subassemblies = sorted(subassemblies, key=lambda s: (s.id, s.pos))
+        subassemblies.sort(key=attrgetter("id", "pos"))
 
-        return AssemblySnapshot(
+        return AssemblySnapshot.model_construct(
             id=assembly.id,
             guid=assembly.guid,
             pos=assembly.position,
@@ -100,7 +106,7 @@ class SnapshotBuilder:
         father = rebar.father
         father_guid = father.guid if father is not None else None
 
-        return ReinforcementSnapshot(
+        return ReinforcementSnapshot.model_construct(
             id=rebar.id,
             guid=rebar.guid,
             pos=rebar.position,
@@ -123,9 +129,7 @@ class SnapshotBuilder:
     @staticmethod
     def _build_cutparts(part: Any) -> list[dict[str, Any]]:
         cutparts = []
-        boolean_enum = part.model_object.GetBooleans()
-        while boolean_enum.MoveNext():
-            boolean_part = boolean_enum.Current
+        for boolean_part in part.model_object.GetBooleans():
             if isinstance(boolean_part, BooleanPart):
                 operative_part = boolean_part.OperativePart
                 if operative_part:
@@ -140,17 +144,15 @@ class SnapshotBuilder:
                             "relative_pos": relative_pos,
                         }
                     )
-        return sorted(cutparts, key=lambda b: (b["id"], b["name"]))
+        cutparts.sort(key=itemgetter("id", "name"))
+        return cutparts
 
     @staticmethod
     def _build_reinforcements(part: Any) -> list[dict[str, Any]]:
         from tekla_mcp_server.tekla.wrappers.model_object import wrap_model_object
 
         reinforcements = []
-        reinf_enum = part.model_object.GetReinforcements()
-        while reinf_enum.MoveNext():
-            rebar = reinf_enum.Current
-
+        for rebar in part.model_object.GetReinforcements():
             prop_names = SnapshotBuilder._get_rebar_prop_names(rebar)
 
             rebar_wrapped = wrap_model_object(rebar)
@@ -169,16 +171,15 @@ class SnapshotBuilder:
                     "user_properties": rebar_udas,
                 }
             )
-        return sorted(reinforcements, key=lambda r: (r["id"], r["name"]))
+        reinforcements.sort(key=itemgetter("id", "name"))
+        return reinforcements
 
     @staticmethod
     def _build_welds(part: Any) -> list[dict[str, Any]]:
         from tekla_mcp_server.tekla.wrappers.model_object import wrap_model_object
 
         welds = []
-        weld_enum = part.model_object.GetWelds()
-        while weld_enum.MoveNext():
-            weld = weld_enum.Current
+        for weld in part.model_object.GetWelds():
             weld_wrapped = wrap_model_object(weld)
             weld_props = weld_wrapped.get_multiple_report_properties(get_config().get_report_props("weld")) if weld_wrapped else {}
             relative_pos = SnapshotBuilder._build_relative_position(weld, part.model_object)
@@ -191,7 +192,8 @@ class SnapshotBuilder:
                     "relative_pos": relative_pos,
                 }
             )
-        return sorted(welds, key=lambda w: w["id"])
+        welds.sort(key=itemgetter("id"))
+        return welds
 
     @staticmethod
     def _build_relative_position(child: Any, parent: Any) -> dict[str, float] | None:
@@ -141,7 +141,9 @@ class TemplateAttributeParser:
         resolved, errors = [], []
 
         for query in queries:
-            name = find_normalized_match(query, cls._cache)
+            # Exact names are the common case (get_elements_properties resolves once, then
+            # re-resolves the same names per element), so skip the full normalized scan for them
+            name = query if query in cls._cache else find_normalized_match(query, cls._cache)
             if not name:
                 name = cls._override_match(query)
             if not name and cls._embeddings_cache:
@@ -67,16 +67,18 @@ def ensure_transformation_plane(func: Callable[..., Any]) -> Callable[..., Any]:
         # Determine the number of objects in args
         selected_object = args[0]  # Supports only the first element
 
-        current_plane = model.model.GetWorkPlaneHandler().GetCurrentTransformationPlane()
+        # The handler is fetched once and reused for the get, set and restore
+        work_plane_handler = model.model.GetWorkPlaneHandler()
+        current_plane = work_plane_handler.GetCurrentTransformationPlane()
         local_plane = TransformationPlane(selected_object.GetCoordinateSystem())
 
         try:
-            model.model.GetWorkPlaneHandler().SetCurrentTransformationPlane(local_plane)
+            work_plane_handler.SetCurrentTransformationPlane(local_plane)
             # Call the actual function
             result = func(model, component, *args, **kwargs)
         finally:
             # Reset transformation plane after execution
-            model.model.GetWorkPlaneHandler().SetCurrentTransformationPlane(current_plane)
+            work_plane_handler.SetCurrentTransformationPlane(current_plane)
 
         return result
 
@@ -205,44 +207,50 @@ def get_wall_pairs(selected_objects: ModelObjectEnumerator) -> list[tuple[ModelO
             tolerance = get_tolerance("wall_pairing", 50.0)
         return abs(value1 - value2) <= tolerance
 
-    selected_walls = []
-    for selected_object in selected_objects:
-        if isinstance(selected_object, Beam):
-            selected_walls.append(selected_object)
+    # Step 1. Filter out non-walls and validate number of floors in the same pass
+    selected_walls: list[tuple[ModelObject, tuple[float, float, float], tuple[float, float, float]]] = []
+    floor_set: set[float] = set()
+    for wall in selected_objects:
+        if not isinstance(wall, Beam):
+            continue
 
-    if len(selected_walls) < 2:
-        raise ValueError("Less than two elements selected. Please select two elements.")
+        # Each point read crosses into .NET, so both points are read once per wall and reused below
+        start_point, end_point = wall.StartPoint, wall.EndPoint
+        start = (start_point.X, start_point.Y, start_point.Z)
+        end = (end_point.X, end_point.Y, end_point.Z)
+        selected_walls.append((wall, start, end))
 
-    # Step 1. Validate number of floors
-    floor_set: set[float] = set()
-    for wall in selected_walls:
-        if round(wall.StartPoint.Z, 2) != round(wall.EndPoint.Z, 2):
+        start_z = start[2]
+        if round(start_z, 2) != round(end[2], 2):
             raise ValueError(f"Z-coordinate mismatch for the start point and end point in the wall {wall.Name}.")
 
         # Check if this Z-value is close to an existing one
         close_match_found = False
         for existing_z in floor_set:
-            if is_within_tolerance(existing_z, wall.StartPoint.Z):
+            if is_within_tolerance(existing_z, start_z):
                 # No need to check further
                 close_match_found = True
                 break
 
         # Add Z only if no close match is found
         if not close_match_found:
-            floor_set.add(wall.StartPoint.Z)
+            floor_set.add(start_z)
+
+    if len(selected_walls) < 2:
+        raise ValueError("Less than two elements selected. Please select two elements.")
 
     if len(floor_set) > 2:
         raise ValueError("More than two floors detected.")
 
     # Step 2. Sort walls by (X, Y) and Z-coordinates
-    selected_walls.sort(key=lambda w: (w.StartPoint.X, w.StartPoint.Y, w.StartPoint.Z))
+    selected_walls.sort(key=lambda w: w[1])
 
     # Step 3. Pair bottom_wall with top_wall
     wall_pairs: Any = []
     wall_dict: Any = {}
 
-    for wall in selected_walls:
-        xy_key = ((round(wall.StartPoint.X, 2), round(wall.StartPoint.Y, 2)), (round(wall.EndPoint.X, 2), round(wall.EndPoint.Y, 2)))
+    for wall, start, end in selected_walls:
+        xy_key = ((round(start[0], 2), round(start[1], 2)), (round(end[0], 2), round(end[1], 2)))
 
         # Find a matching wall within allowed tolerance
         matched_key = None
@@ -257,18 +265,18 @@ def get_wall_pairs(selected_objects: ModelObjectEnumerator) -> list[tuple[ModelO
                 break
 
         if matched_key:
-            bottom_wall = wall_dict[matched_key]
+            bottom_wall, bottom_z = wall_dict[matched_key]
             top_wall = wall
 
             # Only pair walls on different floors. Two walls with matching footprints
             # at the same Z level are co-planar, not a vertical bottom/top stack, and a
             # seam between them would be meaningless geometry
-            if bottom_wall != top_wall and not is_within_tolerance(bottom_wall.StartPoint.Z, top_wall.StartPoint.Z):
+            if bottom_wall != top_wall and not is_within_tolerance(bottom_z, start[2]):
                 # List of tuples as output
                 wall_pairs.append((bottom_wall, top_wall))
                 del wall_dict[matched_key]  # Remove matched pair from storage
         else:
-            wall_dict[xy_key] = wall  # Store as potential bottom wall
+            wall_dict[xy_key] = (wall, start[2])  # Store as potential bottom wall
 
     logger.debug("Wall pairs identified: %s", wall_pairs)
     return wall_pairs
@@ -372,12 +380,8 @@ def iterate_boolean_parts(model_object: ModelObject) -> list[ModelObject]:
     Returns:
         List of BooleanPart objects attached to the model object
     """
-    boolean_parts: list[ModelObject] = []
-    boolean_enum = model_object.GetBooleans()
-    while boolean_enum.MoveNext():
-        if isinstance(boolean_enum.Current, BooleanPart):
-            boolean_parts.append(boolean_enum.Current)
-    return boolean_parts
+    # pythonnet steps the enumerator itself, so Current is read once per item on the .NET side
+    return [boolean_part for boolean_part in model_object.GetBooleans() if isinstance(boolean_part, BooleanPart)]
 
 
 def get_all_profiles() -> list[dict[str, str]]:
@@ -11,7 +11,7 @@ from typing import ClassVar
 
 from tekla_mcp_server.init import logger
 from tekla_mcp_server.utils import log_function_call
-from tekla_mcp_server.tekla.filter_builder import add_filter
+from tekla_mcp_server.tekla.filter_builder import add_filter, add_numeric_filter
 from tekla_mcp_server.tekla.interop import to_array_list
 
 from tekla_mcp_server.tekla.loader import (
@@ -64,6 +64,10 @@ class TeklaModel:
         return cls._instance
 
     def __init__(self):
+        # Providers call TeklaModel() on every tool invocation. Once connected,
+        # _initialized never flips back to False, so skip the lock on that path
+        if self._initialized:
+            return
         with self._connect_lock:
             if self._initialized:
                 return
@@ -248,7 +252,7 @@ class TeklaModel:
         """
         filter_collection = BinaryFilterExpressionCollection()
         add_filter(filter_collection, ObjectFilterExpressions.Type(), TeklaStructuresDatabaseTypeEnum.PART)
-        add_filter(filter_collection, PartFilterExpressions.Class(), tekla_class)
+        add_numeric_filter(filter_collection, PartFilterExpressions.Class(), tekla_class)
 
         return self.get_objects_by_filter(filter_collection)
 
@@ -267,10 +271,12 @@ class TeklaModel:
             ArrayList containing the found model objects. Shorter than `guids` when
             some of them do not resolve.
         """
-        objects_to_select = ArrayList()
+        # Size the list up front and check the connection once, not once per GUID
+        objects_to_select = ArrayList(len(guids))
+        model = self.model
         missing: list[str] = []
         for guid in guids:
-            obj = self.model.SelectModelObject(Identifier(guid))
+            obj = model.SelectModelObject(Identifier(guid))
             if obj is not None:
                 objects_to_select.Add(obj)
             else:
@@ -352,6 +358,10 @@ class TeklaModel:
         if isinstance(model_objects, ArrayList):
             return selector.Select(model_objects)
 
+        # An enumerator is not Sized, but it knows its size, so the copy is still preallocated
+        if isinstance(model_objects, ModelObjectEnumerator):
+            return selector.Select(to_array_list(model_objects, model_objects.GetSize()))
+
         return selector.Select(to_array_list(model_objects))
 
     @staticmethod
@@ -7,11 +7,12 @@ from __future__ import annotations
 import math
 from collections.abc import Generator, Iterable
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, overload
 
 from tekla_mcp_server.config import get_config, get_tolerance
 from tekla_mcp_server.init import logger
-from tekla_mcp_server.models import AssemblySnapshot, NumberingSeries, PartSnapshot, ReinforcementSnapshot, BeamType, OffsetInput, PointInput, PositionInput
+from tekla_mcp_server.models import AssemblySnapshot, NumberingSeries, PartSnapshot, ReinforcementSnapshot, BeamType, OffsetInput, PointInput, PositionInput, ReportProperty
 from tekla_mcp_server.utils import validate_property_type
 
 from tekla_mcp_server.tekla.loader import (
@@ -36,6 +37,7 @@ from tekla_mcp_server.tekla.loader import (
 )
 
 
+from tekla_mcp_server.tekla.interop import to_array_list
 from tekla_mcp_server.tekla.snapshot_builder import SnapshotBuilder
 from tekla_mcp_server.tekla.template_attrs_parser import TemplateAttributeParser
 
@@ -88,13 +90,18 @@ class BoundingBox:
         max_z: Maximum Z coordinate
     """
 
+    # Held per element by copy_properties_from_ifc, so keep instances small
+    __slots__ = ("min_x", "max_x", "min_y", "max_y", "min_z", "max_z")
+
     def __init__(self, model_object: TeklaModelObject):
-        self.min_x = float(model_object.get_report_property("BOUNDING_BOX_MIN_X"))
-        self.max_x = float(model_object.get_report_property("BOUNDING_BOX_MAX_X"))
-        self.min_y = float(model_object.get_report_property("BOUNDING_BOX_MIN_Y"))
-        self.max_y = float(model_object.get_report_property("BOUNDING_BOX_MAX_Y"))
-        self.min_z = float(model_object.get_report_property("BOUNDING_BOX_MIN_Z"))
-        self.max_z = float(model_object.get_report_property("BOUNDING_BOX_MAX_Z"))
+        # One batched read, a missing coordinate raises AttributeError
+        values = model_object.get_required_report_properties(["BOUNDING_BOX_MIN_X", "BOUNDING_BOX_MAX_X", "BOUNDING_BOX_MIN_Y", "BOUNDING_BOX_MAX_Y", "BOUNDING_BOX_MIN_Z", "BOUNDING_BOX_MAX_Z"])
+        self.min_x = float(values["BOUNDING_BOX_MIN_X"])
+        self.max_x = float(values["BOUNDING_BOX_MAX_X"])
+        self.min_y = float(values["BOUNDING_BOX_MIN_Y"])
+        self.max_y = float(values["BOUNDING_BOX_MAX_Y"])
+        self.min_z = float(values["BOUNDING_BOX_MIN_Z"])
+        self.max_z = float(values["BOUNDING_BOX_MAX_Z"])
 
     @property
     def centroid(self) -> tuple[float, float, float]:
@@ -184,9 +191,18 @@ def _ray_cast_inside(solid_self: Solid, solid_other: Solid) -> bool:
     return count % 2 == 1
 
 
+def extents_overlap(a: tuple[float, ...], b: tuple[float, ...]) -> bool:
+    """
+    Inclusive AABB overlap test on `SolidGeometryMixin.get_solid_extents` tuples.
+    """
+    return a[0] <= b[3] and a[3] >= b[0] and a[1] <= b[4] and a[4] >= b[1] and a[2] <= b[5] and a[5] >= b[2]
+
+
 class SolidGeometryMixin:
     """Mixin for wrapped model objects that support Tekla solid geometry queries."""
 
+    __slots__ = ()
+
     @property
     def model_object(self) -> ModelObject:
         raise NotImplementedError
@@ -197,6 +213,18 @@ class SolidGeometryMixin:
         """
         return self.model_object.GetSolid()
 
+    def get_solid_extents(self) -> tuple[float, float, float, float, float, float] | None:
+        """
+        Returns the solid AABB as (min X, min Y, min Z, max X, max Y, max Z) floats, or None if there is no solid.
+
+        Callers that test one object against many can keep the tuple instead of re-reading the solid.
+        """
+        solid = self.get_solid()
+        if not solid:
+            return None
+        min_point, max_point = solid.MinimumPoint, solid.MaximumPoint
+        return min_point.X, min_point.Y, min_point.Z, max_point.X, max_point.Y, max_point.Z
+
     def is_inside(self, other: TeklaModelObject) -> bool:
         """
         Return True if `self` object lies inside `other` using an odd/even ray-cast test.
@@ -331,11 +359,32 @@ def _get_top_assembly(assembly: ModelObject) -> "TeklaAssembly":
     return TeklaAssembly(assembly)
 
 
+@lru_cache(maxsize=32)
+def _resolve_report_props(report_props_definitions: tuple[str, ...]) -> tuple[ReportProperty, ...]:
+    """
+    Resolves report property definitions to their attribute metadata.
+
+    Cached because get_elements_properties passes the same definitions for every selected
+    element, and the attribute definitions do not change once loaded.
+    """
+    resolution = TemplateAttributeParser.resolve_attributes(list(report_props_definitions))
+    parsed_props = []
+    for attr_name in resolution.get("resolved", []):
+        try:
+            parsed_props.append(TemplateAttributeParser.get_attribute(attr_name))
+        except KeyError:
+            logger.debug("Attribute '%s' not found in cache", attr_name)
+    return tuple(parsed_props)
+
+
 class TeklaModelObject:
     """
     A base wrapper class around the Tekla Structures ModelObject object.
     """
 
+    # One wrapper is built per selected element, so skip the per-instance __dict__
+    __slots__ = ("_model_object",)
+
     def __init__(self, model_object: ModelObject):
         self._model_object = model_object
 
@@ -382,12 +431,13 @@ class TeklaModelObject:
     def cog(self) -> Point:
         """
         Retrieves the center of gravity (COG) point for a given Tekla model object.
-        """
-        cog_x = self.get_report_property("COG_X")
-        cog_y = self.get_report_property("COG_Y")
-        cog_z = self.get_report_property("COG_Z")
 
-        return Point(cog_x, cog_y, cog_z)
+        Raises:
+            AttributeError: If a COG coordinate cannot be retrieved for the element.
+        """
+        # One batched report read instead of three, this runs once per labeled element
+        values = self.get_required_report_properties(["COG_X", "COG_Y", "COG_Z"])
+        return Point(values["COG_X"], values["COG_Y"], values["COG_Z"])
 
     @property
     def bounding_box(self) -> BoundingBox | None:
@@ -477,15 +527,54 @@ class TeklaModelObject:
     def get_multiple_report_properties(self, prop_names: list[str]) -> dict[str, str | int | float | None]:
         """
         Fetches multiple report properties.
+
+        Known attributes are bucketed by data type and read with a single GetAllReportProperties
+        call instead of one GetReportProperty call each. Attributes missing from Tekla's attribute
+        definitions fall back to get_report_property, so subclass fallbacks still apply.
+        Properties that are not available for the element map to None.
         """
-        result: dict[str, str | int | float | None] = {}
-        for prop in prop_names:
+        # Repeated names would reach the .NET call twice, so each name is read once
+        unique_names = list(dict.fromkeys(prop_names))
+        names_by_type: dict[type, list[str]] = {str: [], float: [], int: []}
+        unknown_names: list[str] = []
+        for prop in unique_names:
             try:
-                result[prop] = self.get_report_property(prop)
-            except Exception:
+                names_by_type[TemplateAttributeParser.get_attribute(prop).data_type].append(prop)
+            except KeyError:
+                unknown_names.append(prop)
+
+        values = Hashtable()
+        if len(unknown_names) < len(unique_names):
+            # The return value is False if any single property is missing, the rest are still filled in
+            _, values = self.model_object.GetAllReportProperties(to_array_list(names_by_type[str]), to_array_list(names_by_type[float]), to_array_list(names_by_type[int]), values)
+
+        result: dict[str, str | int | float | None] = {}
+        for prop in unique_names:
+            if values.ContainsKey(prop):
+                result[prop] = values[prop]
+            elif prop in unknown_names:
+                try:
+                    result[prop] = self.get_report_property(prop)
+                except Exception:
+                    result[prop] = None
+            else:
                 result[prop] = None
         return result
 
+    def get_required_report_properties(self, prop_names: list[str]) -> dict[str, str | int | float]:
+        """
+        Fetches multiple report properties that must all be available, in one batched read.
+
+        Raises:
+            AttributeError: If any of the properties cannot be retrieved for the element.
+        """
+        result: dict[str, str | int | float] = {}
+        for prop, value in self.get_multiple_report_properties(prop_names).items():
+            if value is None:
+                raise AttributeError(f"Failed to retrieve property `{prop}`.")
+            result[prop] = value
+        return result
+
     def get_properties(self, report_props_definitions: list[str] | None = None) -> dict[str, Any]:
         """
         Gets element properties as dict.
@@ -505,30 +594,22 @@ class TeklaModelObject:
         if not report_props_definitions:
             return []
 
-        resolution = TemplateAttributeParser.resolve_attributes(report_props_definitions)
-        resolved = resolution.get("resolved", [])
+        parsed_props = _resolve_report_props(tuple(report_props_definitions))
+        values = self.get_multiple_report_properties([parsed_prop.name for parsed_prop in parsed_props])
 
         result = []
-        for attr_name in resolved:
-            value = None
-            parsed_prop = None
-            try:
-                parsed_prop = TemplateAttributeParser.get_attribute(attr_name)
-                value = self.get_report_property(attr_name)
-            except KeyError:
-                logger.debug("Attribute '%s' not found in cache", attr_name)
-            except Exception:
-                logger.debug("Property '%s' not available for this element", attr_name)
-
-            if parsed_prop is not None:
-                result.append(
-                    {
-                        "name": parsed_prop.name,
-                        "data_type": parsed_prop.data_type.__name__,
-                        "unit": parsed_prop.unit,
-                        "value": value,
-                    }
-                )
+        for parsed_prop in parsed_props:
+            value = values[parsed_prop.name]
+            if value is None:
+                logger.debug("Property '%s' not available for this element", parsed_prop.name)
+            result.append(
+                {
+                    "name": parsed_prop.name,
+                    "data_type": parsed_prop.data_type.__name__,
+                    "unit": parsed_prop.unit,
+                    "value": value,
+                }
+            )
         return result
 
     def _set_property(self, prop_name: str, value: str) -> None:
@@ -558,6 +639,8 @@ class TeklaReferenceModelObject(TeklaModelObject):
     A wrapper class around the Tekla Structures ReferenceModelObject object.
     """
 
+    __slots__ = ()
+
     def get_report_property(self, property_name: str) -> str | int | float:
         """
         Retrieves a report property from ReferenceModelObject.
@@ -621,6 +704,8 @@ class TeklaBoltGroup(TeklaModelObject):
     A wrapper class around the Tekla Structures BoltGroup object.
     """
 
+    __slots__ = ()
+
     @property
     def bolt_standard(self) -> str:
         """
@@ -675,6 +760,8 @@ class TeklaAssembly(TeklaModelObject):
     A wrapper class around the Tekla Structures Assembly object.
     """
 
+    __slots__ = ()
+
     @property
     def position(self) -> str:
         """
@@ -859,8 +946,9 @@ class TeklaAssembly(TeklaModelObject):
         props = super().get_properties(report_props_definitions)
         props["position"] = self.position
         props["name"] = self.name
-        props["assembly_prefix"] = self.assembly_number.prefix
-        props["assembly_start_number"] = self.assembly_number.start_number
+        assembly_number = self.assembly_number
+        props["assembly_prefix"] = assembly_number.prefix
+        props["assembly_start_number"] = assembly_number.start_number
         return props
 
     def set_properties(
@@ -935,6 +1023,8 @@ class TeklaPart(TeklaModelObject, SolidGeometryMixin):
     A wrapper class around the Tekla Structures Part object.
     """
 
+    __slots__ = ()
+
     @overload
     def get_solid(self) -> Solid: ...
 
@@ -1092,34 +1182,35 @@ class TeklaPart(TeklaModelObject, SolidGeometryMixin):
         props["material"] = self.material
         props["finish"] = self.finish
         props["tekla_class"] = self.tekla_class
-        props["part_prefix"] = self.part_number.prefix
-        props["part_start_number"] = self.part_number.start_number
-        props["assembly_prefix"] = self.assembly_number.prefix
-        props["assembly_start_number"] = self.assembly_number.start_number
+        # Each numbering property re-reads the .NET series, so read each one once
+        part_number = self.part_number
+        props["part_prefix"] = part_number.prefix
+        props["part_start_number"] = part_number.start_number
+        assembly_number = self.assembly_number
+        props["assembly_prefix"] = assembly_number.prefix
+        props["assembly_start_number"] = assembly_number.start_number
         return props
 
     def has_spatial_overlap(self, other: SolidGeometryMixin) -> bool:
         """
         Checks whether the bounding boxes of this Tekla part and another SolidGeometryMixin object intersect.
         """
-        solid_self = self.get_solid()
-        solid_other = other.get_solid()
+        extents_self = self.get_solid_extents()
+        extents_other = other.get_solid_extents()
 
-        if not (solid_self and solid_other):
+        if extents_self is None or extents_other is None:
             return False
 
-        min_self, max_self = solid_self.MinimumPoint, solid_self.MaximumPoint
-        min_other, max_other = solid_other.MinimumPoint, solid_other.MaximumPoint
+        return extents_overlap(extents_self, extents_other)
 
-        return min_self.X <= max_other.X and max_self.X >= min_other.X and min_self.Y <= max_other.Y and max_self.Y >= min_other.Y and min_self.Z <= max_other.Z and max_self.Z >= min_other.Z
-
-    def add_cut(self, cutting_part: TeklaPart, delete_cutting_part: bool = False) -> bool:
+    def add_cut(self, cutting_part: TeklaPart, delete_cutting_part: bool = False, check_overlap: bool = True) -> bool:
         """
         Attempts to perform a boolean cut operation on this Tekla part using a TeklaPart as the cutting part.
 
         The method first checks for self-cutting and spatial overlap between the objects. If valid, it sets the cutting part
         as a Boolean operator and performs the cut. It then compares the volume before and after the operation to verify
         that the cut had an effect. Optionally deletes the cutting part from the model if the cut was successful.
+        Pass `check_overlap=False` when the caller has already tested the extents with `extents_overlap`.
         """
         if self.model_object is None or cutting_part.model_object is None:
             logger.warning("Boolean cut skipped: one or both model objects are None")
@@ -1129,7 +1220,7 @@ class TeklaPart(TeklaModelObject, SolidGeometryMixin):
             logger.warning("Boolean cut skipped: self-cutting detected")
             return False
 
-        if not self.has_spatial_overlap(cutting_part):
+        if check_overlap and not self.has_spatial_overlap(cutting_part):
             logger.warning("Boolean cut skipped: no spatial overlap")
             return False
 
@@ -1167,13 +1258,8 @@ class TeklaPart(TeklaModelObject, SolidGeometryMixin):
         objects = [self._model_object]
 
         if include_all:
-            welds = self._model_object.GetWelds()
-            while welds.MoveNext():
-                objects.append(welds.Current)
-
-            reinfs = self._model_object.GetReinforcements()
-            while reinfs.MoveNext():
-                objects.append(reinfs.Current)
+            objects.extend(self._model_object.GetWelds())
+            objects.extend(self._model_object.GetReinforcements())
 
         return objects
 
@@ -1341,6 +1427,8 @@ class TeklaBeam(TeklaPart):
     Inherits from TeklaPart.
     """
 
+    __slots__ = ("_beam",)
+
     def __init__(self, beam: Beam | None = None):
         super().__init__(beam)
         self._beam = beam
@@ -1471,6 +1559,8 @@ class TeklaContourPlate(TeklaPart):
     Inherits from TeklaPart.
     """
 
+    __slots__ = ("_slab",)
+
     def __init__(self, slab: ContourPlate | None = None):
         super().__init__(slab)
         self._slab = slab
@@ -1555,6 +1645,8 @@ class TeklaReinforcement(TeklaModelObject, SolidGeometryMixin):
     A wrapper class around the Tekla Structures Reinforcement object.
     """
 
+    __slots__ = ()
+
     @property
     def position(self) -> str:
         """
@@ -160,6 +160,23 @@ class TestElementTypeClassMapping:
             result = ElementTypes.get_element_type_by_class(13)
         assert result == ("MATERIAL_CONCRETE", "COLUMN")
 
+    def test_get_class_mapping_reused_until_element_types_change(self):
+        """The inverted mapping is built once per loaded element_types dict."""
+        element_types = _make_element_types()
+        with patch("tekla_mcp_server.config._load_json", return_value=element_types):
+            first = ElementTypes.get_class_mapping()
+            assert ElementTypes.get_class_mapping() is first
+        with patch("tekla_mcp_server.config._load_json", side_effect=_mock_load_json_for_element_types):
+            assert ElementTypes.get_class_mapping() is not first
+
+    def test_get_element_type_classes_collects_matching_types(self):
+        """Classes of every type whose name contains the requested one are collected in config order."""
+        with patch("tekla_mcp_server.config._load_json", side_effect=_mock_load_json_for_element_types):
+            config = Config()
+            assert config.get_element_type_classes("BEAM") == [1, 2]
+            assert config.get_element_type_classes("COLUMN") == [13]
+            assert config.get_element_type_classes("TRUSS") == []
+
     def test_no_duplicate_classes_unchanged(self):
         """Classes that appear only once are not affected by the setdefault logic."""
         with patch("tekla_mcp_server.config._load_json", side_effect=_mock_load_json_for_element_types):
@@ -0,0 +1,66 @@
+"""
+Unit tests for `providers.selection_provider`.
+
+These tests require a live Tekla Structures environment and will be skipped in CI environments
+where Tekla is not available, since `selection_provider` transitively imports `tekla/loader.py`.
+"""
+
+import os
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+
+if os.getenv("CI") == "true":
+    pytest.skip("Skipping all tests (Tekla not available in CI)", allow_module_level=True)
+
+from tekla_mcp_server.providers.selection_provider import select_elements_assemblies_or_main_parts
+
+
+def _assembly(assembly_id, main_part=None):
+    """Stub top-level assembly, `main_part` raises ValueError when not given."""
+    assembly = MagicMock()
+    assembly.id = assembly_id
+    if main_part is None:
+        type(assembly).main_part = PropertyMock(side_effect=ValueError("no main part"))
+    else:
+        assembly.main_part = main_part
+    return assembly
+
+
+def _part(assembly):
+    """Stub wrapped part whose top-level assembly is `assembly`."""
+    part = MagicMock()
+    part.get_top_level_assembly.return_value = assembly
+    return part
+
+
+def _run(mode, parts):
+    """Runs the tool over `parts` with TeklaModel patched, returns (structured content, select_objects mock)."""
+    with (
+        patch("tekla_mcp_server.providers.selection_provider.TeklaModel") as model_cls,
+        patch("tekla_mcp_server.providers.selection_provider.wrap_model_objects", return_value=iter(parts)),
+    ):
+        model_cls.return_value.get_selected_objects.return_value.GetSize.return_value = len(parts)
+        result = select_elements_assemblies_or_main_parts(mode=mode)
+    return result.structured_content, model_cls.select_objects
+
+
+def test_main_part_mode_skips_every_part_of_assembly_without_main_part():
+    """Both parts of an assembly with no main part are skipped, and the lookup runs once."""
+    assembly = _assembly(7)
+    content, select_objects = _run("Main Part", [_part(assembly), _part(assembly)])
+    assert content["processed_count"] == 0
+    assert content["selected_main_parts_count"] == 0
+    assert content["status"] == "warning"
+    select_objects.assert_called_once_with([])
+    assert vars(type(assembly))["main_part"].call_count == 1
+
+
+def test_main_part_mode_selects_shared_main_part_once():
+    """Two parts of one assembly are both processed, but its main part is selected once."""
+    main_part = MagicMock()
+    assembly = _assembly(7, main_part=main_part)
+    content, select_objects = _run("Main Part", [_part(assembly), _part(assembly)])
+    assert content["processed_count"] == 2
+    assert content["selected_main_parts_count"] == 1
+    select_objects.assert_called_once_with([main_part.model_object])
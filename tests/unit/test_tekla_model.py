@@ -83,6 +83,12 @@ class TestConnection:
         instance = _connected_instance()
         assert instance.ensure_connected() is True
 
+    def test_repeated_construction_reuses_connection(self):
+        instance = _connected_instance()
+        with patch("tekla_mcp_server.tekla.wrappers.model.Model") as model_cls:
+            assert TeklaModel() is instance
+            model_cls.assert_not_called()
+
     def test_model_property_returns_live_handle(self):
         instance = _connected_instance()
         assert instance.model is instance._model
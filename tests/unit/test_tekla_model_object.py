@@ -12,14 +12,18 @@ if os.getenv("CI") == "true":
     pytest.skip("Skipping all tests (Tekla not available in CI)", allow_module_level=True)
 
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from tekla_mcp_server.tekla.loader import Beam, Position, Point
-from tekla_mcp_server.tekla.wrappers.model_object import wrap_model_object, TeklaBoltGroup, TeklaPart
+from tekla_mcp_server.tekla.template_attrs_parser import TemplateAttributeParser
+from tekla_mcp_server.tekla.wrappers.model_object import _resolve_report_props, extents_overlap, wrap_model_object, TeklaBoltGroup, TeklaPart
 
 
 created_elements: Any = []
 
+# Expected weight of a 2000 x 3000 x 200 mm concrete wall
+WEIGHT_APPROX = pytest.approx(2880.0, abs=0.1)
+
 
 @pytest.fixture(scope="module", autouse=True)
 def cleanup():
@@ -35,22 +39,27 @@ def cleanup():
 
 def mock_beam(x, y, z, name="TEST_WALL"):
     """Helper for mocking beams."""
-    beam = Beam()
+    # The (start, end) constructor sets both points in one interop call
+    beam = Beam(Point(x, y, z), Point(x + 2000, y, z))
     beam.Profile.ProfileString = "3000*200"
     beam.Material.MaterialString = "Concrete_Undefined"
     beam.Class = "1"
     beam.Name = name
     beam.Position.Depth = Position.DepthEnum.FRONT
-    beam.StartPoint = Point(x, y, z)
-    beam.EndPoint = Point(x + 2000, y, z)
     beam.Insert()
     created_elements.append(beam)
     return beam
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def wall1():
-    """Returns a TeklaModelObject wrapping a mock beam."""
+    """Returns a TeklaModelObject wrapping a mock beam, shared by the read-only tests of the module."""
+    return wrap_model_object(mock_beam(0, 0, 0, "TEST_WALL1"))
+
+
+@pytest.fixture
+def fresh_wall1():
+    """Returns a TeklaModelObject wrapping a new mock beam, for tests that modify the element."""
     return wrap_model_object(mock_beam(0, 0, 0, "TEST_WALL1"))
 
 
@@ -68,7 +77,6 @@ def test_position_property(wall1):
 
 def test_id_property(wall1):
     """Checks that the ID property is an int."""
-    assert wall1.guid is not None
     assert isinstance(wall1.id, int)
 
 
@@ -110,7 +118,7 @@ def test_cog_property(wall1):
 def test_weight_property(wall1):
     """Checks that the total and rebar weights are correctly returned."""
     total_weight, rebar_weight = wall1.weight
-    assert total_weight == pytest.approx(2880.0, abs=0.1)
+    assert total_weight == WEIGHT_APPROX
     assert rebar_weight == 0.0
 
 
@@ -132,7 +140,7 @@ def test_get_top_level_parts(wall1):
 
 def test_get_report_property_weight_property(wall1):
     """Checks that a report property can be retrieved correctly."""
-    assert wall1.get_report_property("WEIGHT") == pytest.approx(2880.0, abs=0.1)
+    assert wall1.get_report_property("WEIGHT") == WEIGHT_APPROX
 
 
 def test_get_report_property_invalid(wall1):
@@ -141,21 +149,53 @@ def test_get_report_property_invalid(wall1):
         wall1.get_report_property("INVALID_PROPERTY_NAME")
 
 
+def test_get_multiple_report_properties_matches_single_reads(wall1):
+    """Checks that the batched read returns the same values as per-property reads, None for unknown names."""
+    props = wall1.get_multiple_report_properties(["WEIGHT", "GUID", "INVALID_PROPERTY_NAME"])
+    assert props["WEIGHT"] == WEIGHT_APPROX
+    assert props["GUID"] == wall1.get_report_property("GUID")
+    assert props["INVALID_PROPERTY_NAME"] is None
+
+
+def test_get_multiple_report_properties_repeated_names(wall1):
+    """Checks that a name requested twice is read once and returned under one key."""
+    props = wall1.get_multiple_report_properties(["COG_X", "WEIGHT", "COG_X"])
+    assert list(props) == ["COG_X", "WEIGHT"]
+    assert props["WEIGHT"] == WEIGHT_APPROX
+
+
+def test_get_required_report_properties_raises_for_missing(wall1):
+    """Checks that a property the batched read cannot retrieve raises AttributeError."""
+    assert wall1.get_required_report_properties(["WEIGHT"])["WEIGHT"] == WEIGHT_APPROX
+    with pytest.raises(AttributeError):
+        wall1.get_required_report_properties(["WEIGHT", "INVALID_PROPERTY_NAME"])
+
+
+def test_report_properties_resolved_once_per_definition_set(wall1):
+    """Checks that repeated get_properties calls with the same definitions reuse one attribute resolution."""
+    _resolve_report_props.cache_clear()
+    with patch("tekla_mcp_server.tekla.wrappers.model_object.TemplateAttributeParser.resolve_attributes", wraps=TemplateAttributeParser.resolve_attributes) as resolve:
+        first = wall1.get_properties(["WEIGHT"])["report_properties"]
+        second = wall1.get_properties(["WEIGHT"])["report_properties"]
+    assert resolve.call_count == 1
+    assert first == second
+
+
 def test_get_user_property_invalid(wall1):
     """Checks that accessing an invalid user property raises AttributeError."""
     with pytest.raises(AttributeError):
         wall1.get_user_property("InvalidProperty", str)
 
 
-def test_get_user_property_test_property(wall1):
+def test_get_user_property_test_property(fresh_wall1):
     """Checks that a user-defined property can be retrieved correctly."""
-    wall1.set_user_property("TestProperty", "TestValue")
-    assert wall1.get_user_property("TestProperty", str) == "TestValue"
+    fresh_wall1.set_user_property("TestProperty", "TestValue")
+    assert fresh_wall1.get_user_property("TestProperty", str) == "TestValue"
 
 
-def test_set_user_property_test_property(wall1):
+def test_set_user_property_test_property(fresh_wall1):
     """Checks that setting a user-defined property returns True on success."""
-    assert wall1.set_user_property("TestProperty", "TestValue") is True
+    assert fresh_wall1.set_user_property("TestProperty", "TestValue") is True
 
 
 def test_get_all_user_properties_empty(wall1):
@@ -163,11 +203,11 @@ def test_get_all_user_properties_empty(wall1):
     assert not wall1.get_all_user_properties()
 
 
-def test_get_all_user_properties_test_property(wall1):
+def test_get_all_user_properties_test_property(fresh_wall1):
     """Checks that a user-defined property can be retrieved correctly."""
-    wall1.set_user_property("TestProperty", "TestValue")
-    assert len(wall1.get_all_user_properties()) == 1
-    assert wall1.get_all_user_properties()["TestProperty"] == "TestValue"
+    fresh_wall1.set_user_property("TestProperty", "TestValue")
+    assert len(fresh_wall1.get_all_user_properties()) == 1
+    assert fresh_wall1.get_all_user_properties()["TestProperty"] == "TestValue"
 
 
 def test_has_spatial_overlap_no_overlap(wall1):
@@ -177,6 +217,21 @@ def test_has_spatial_overlap_no_overlap(wall1):
     assert wall1.has_spatial_overlap(other_wall) is False
 
 
+def test_get_solid_extents_matches_overlap_check(wall1):
+    """Checks that the extents tuple overlaps itself and not a distant wall's extents."""
+    extents = wall1.get_solid_extents()
+    assert extents is not None
+    assert extents_overlap(extents, extents) is True
+    other_extents = wrap_model_object(mock_beam(10000, 10000, 10000, "TEST_WALL_OTHER")).get_solid_extents()
+    assert extents_overlap(extents, other_extents) is False
+
+
+def test_extents_overlap_touching_faces():
+    """Checks that boxes sharing a face count as overlapping, and separated boxes do not."""
+    assert extents_overlap((0, 0, 0, 1, 1, 1), (1, 0, 0, 2, 1, 1)) is True
+    assert extents_overlap((0, 0, 0, 1, 1, 1), (1.5, 0, 0, 2, 1, 1)) is False
+
+
 def test_wrap_model_object_returns_tekla_part(wall1):
     """Checks that wrap_model_object returns TeklaPart for a Beam."""
     wrapped = wrap_model_object(wall1.model_object)
@@ -264,9 +319,9 @@ def test_assembly_to_snapshot_serializable(wall1):
     assert isinstance(json_str, str)
 
 
-def test_assembly_set_properties_name(wall1):
+def test_assembly_set_properties_name(fresh_wall1):
     """Checks that assembly name can be changed using set_properties."""
-    assembly = wall1.get_top_level_assembly()
+    assembly = fresh_wall1.get_top_level_assembly()
     original_name = assembly.name
 
     changes = assembly.set_properties(name="NEW_ASSEMBLY_NAME")
@@ -278,9 +333,9 @@ def test_assembly_set_properties_name(wall1):
     assert assembly.name == original_name
 
 
-def test_assembly_set_properties_assembly_numbering(wall1):
+def test_assembly_set_properties_assembly_numbering(fresh_wall1):
     """Checks that assembly numbering can be changed using set_properties."""
-    assembly = wall1.get_top_level_assembly()
+    assembly = fresh_wall1.get_top_level_assembly()
     original_prefix = assembly.assembly_number.prefix
     original_start = assembly.assembly_number.start_number
 
@@ -320,105 +375,105 @@ def test_part_get_properties(wall1):
     assert props["tekla_class"] == 1
 
 
-def test_part_set_properties_profile(wall1):
+def test_part_set_properties_profile(fresh_wall1):
     """Checks that TeklaPart profile can be changed using set_properties."""
-    original_profile = wall1.profile
+    original_profile = fresh_wall1.profile
 
-    changes = wall1.set_properties(profile="4000*300")
+    changes = fresh_wall1.set_properties(profile="4000*300")
     assert changes["profile"] == 1
-    assert wall1.profile == "4000*300"
+    assert fresh_wall1.profile == "4000*300"
 
-    wall1.set_properties(profile=original_profile)
-    assert wall1.profile == original_profile
+    fresh_wall1.set_properties(profile=original_profile)
+    assert fresh_wall1.profile == original_profile
 
 
-def test_part_set_properties_material(wall1):
+def test_part_set_properties_material(fresh_wall1):
     """Checks that TeklaPart material can be changed using set_properties."""
-    original_material = wall1.material
+    original_material = fresh_wall1.material
 
-    changes = wall1.set_properties(material="CONCRETE-30")
+    changes = fresh_wall1.set_properties(material="CONCRETE-30")
     assert changes["material"] == 1
-    assert wall1.material == "CONCRETE-30"
+    assert fresh_wall1.material == "CONCRETE-30"
 
-    wall1.set_properties(material=original_material)
-    assert wall1.material == original_material
+    fresh_wall1.set_properties(material=original_material)
+    assert fresh_wall1.material == original_material
 
 
-def test_part_set_properties_tekla_class(wall1):
+def test_part_set_properties_tekla_class(fresh_wall1):
     """Checks that TeklaPart class can be changed using set_properties."""
-    original_class = wall1.tekla_class
+    original_class = fresh_wall1.tekla_class
 
-    changes = wall1.set_properties(tekla_class=2)
+    changes = fresh_wall1.set_properties(tekla_class=2)
     assert changes["tekla_class"] == 1
-    assert wall1.tekla_class == 2
+    assert fresh_wall1.tekla_class == 2
 
-    wall1.set_properties(tekla_class=original_class)
-    assert wall1.tekla_class == original_class
+    fresh_wall1.set_properties(tekla_class=original_class)
+    assert fresh_wall1.tekla_class == original_class
 
 
-def test_part_set_properties_finish(wall1):
+def test_part_set_properties_finish(fresh_wall1):
     """Checks that TeklaPart finish can be changed using set_properties."""
-    original_finish = wall1.finish
+    original_finish = fresh_wall1.finish
 
-    changes = wall1.set_properties(finish="R")
+    changes = fresh_wall1.set_properties(finish="R")
     assert changes["finish"] == 1
-    assert wall1.finish == "R"
+    assert fresh_wall1.finish == "R"
 
-    wall1.set_properties(finish=original_finish)
-    assert wall1.finish == original_finish
+    fresh_wall1.set_properties(finish=original_finish)
+    assert fresh_wall1.finish == original_finish
 
 
-def test_part_set_properties_part_numbering(wall1):
+def test_part_set_properties_part_numbering(fresh_wall1):
     """Checks that TeklaPart part numbering can be changed using set_properties."""
-    original_prefix = wall1.part_number.prefix
-    original_start = wall1.part_number.start_number
+    original_prefix = fresh_wall1.part_number.prefix
+    original_start = fresh_wall1.part_number.start_number
 
-    changes = wall1.set_properties(part_prefix="X", part_start_number=500)
+    changes = fresh_wall1.set_properties(part_prefix="X", part_start_number=500)
     assert changes["part_prefix"] == 1
     assert changes["part_start_number"] == 1
-    assert wall1.part_number.prefix == "X"
-    assert wall1.part_number.start_number == 500
+    assert fresh_wall1.part_number.prefix == "X"
+    assert fresh_wall1.part_number.start_number == 500
 
-    wall1.set_properties(part_prefix=original_prefix, part_start_number=original_start)
-    assert wall1.part_number.prefix == original_prefix
-    assert wall1.part_number.start_number == original_start
+    fresh_wall1.set_properties(part_prefix=original_prefix, part_start_number=original_start)
+    assert fresh_wall1.part_number.prefix == original_prefix
+    assert fresh_wall1.part_number.start_number == original_start
 
 
-def test_part_set_properties_assembly_numbering(wall1):
+def test_part_set_properties_assembly_numbering(fresh_wall1):
     """Checks that TeklaPart assembly numbering can be changed using set_properties."""
-    original_prefix = wall1.assembly_number.prefix
-    original_start = wall1.assembly_number.start_number
+    original_prefix = fresh_wall1.assembly_number.prefix
+    original_start = fresh_wall1.assembly_number.start_number
 
-    changes = wall1.set_properties(assembly_prefix="Y", assembly_start_number=600)
+    changes = fresh_wall1.set_properties(assembly_prefix="Y", assembly_start_number=600)
     assert changes["assembly_prefix"] == 1
     assert changes["assembly_start_number"] == 1
-    assert wall1.assembly_number.prefix == "Y"
-    assert wall1.assembly_number.start_number == 600
+    assert fresh_wall1.assembly_number.prefix == "Y"
+    assert fresh_wall1.assembly_number.start_number == 600
 
-    wall1.set_properties(assembly_prefix=original_prefix, assembly_start_number=original_start)
-    assert wall1.assembly_number.prefix == original_prefix
-    assert wall1.assembly_number.start_number == original_start
+    fresh_wall1.set_properties(assembly_prefix=original_prefix, assembly_start_number=original_start)
+    assert fresh_wall1.assembly_number.prefix == original_prefix
+    assert fresh_wall1.assembly_number.start_number == original_start
 
 
-def test_part_set_properties_user_properties(wall1):
+def test_part_set_properties_user_properties(fresh_wall1):
     """Checks that TeklaPart user properties can be set using set_properties."""
-    changes = wall1.set_properties(user_properties={"TestUDA_Part": "PartValue"})
+    changes = fresh_wall1.set_properties(user_properties={"TestUDA_Part": "PartValue"})
     assert changes["udas"] == 1
-    assert wall1.get_user_property("TestUDA_Part", str) == "PartValue"
+    assert fresh_wall1.get_user_property("TestUDA_Part", str) == "PartValue"
 
 
-def test_assembly_set_properties_user_properties(wall1):
+def test_assembly_set_properties_user_properties(fresh_wall1):
     """Checks that TeklaAssembly user properties can be set using set_properties."""
-    assembly = wall1.get_top_level_assembly()
+    assembly = fresh_wall1.get_top_level_assembly()
 
     changes = assembly.set_properties(user_properties={"AssemblyUDA": "AssemblyValue"})
     assert changes["udas"] == 1
     assert assembly.get_user_property("AssemblyUDA", str) == "AssemblyValue"
 
 
-def test_assembly_set_properties_multiple(wall1):
+def test_assembly_set_properties_multiple(fresh_wall1):
     """Checks that multiple TeklaAssembly properties can be changed at once."""
-    assembly = wall1.get_top_level_assembly()
+    assembly = fresh_wall1.get_top_level_assembly()
     original_name = assembly.name
     original_prefix = assembly.assembly_number.prefix
     original_start = assembly.assembly_number.start_number
@@ -486,20 +541,20 @@ def test_assembly_get_properties_includes_phase(wall1):
     assert "part_start_number" not in props
 
 
-def test_part_set_properties_phase(wall1):
+def test_part_set_properties_phase(fresh_wall1):
     """Checks that TeklaPart phase can be changed using set_properties."""
-    original_phase = wall1.phase
+    original_phase = fresh_wall1.phase
 
-    changes = wall1.set_properties(phase=2)
+    changes = fresh_wall1.set_properties(phase=2)
     assert changes["phase"] == 1
-    assert wall1.phase == 2
+    assert fresh_wall1.phase == 2
 
-    wall1.set_properties(phase=original_phase)
+    fresh_wall1.set_properties(phase=original_phase)
 
 
-def test_assembly_set_properties_phase(wall1):
+def test_assembly_set_properties_phase(fresh_wall1):
     """Checks that TeklaAssembly phase can be changed using set_properties."""
-    assembly = wall1.get_top_level_assembly()
+    assembly = fresh_wall1.get_top_level_assembly()
     original_phase = assembly.phase
 
     changes = assembly.set_properties(phase=3)
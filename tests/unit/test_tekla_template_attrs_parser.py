@@ -6,6 +6,7 @@ where Tekla is not available.
 """
 
 import os
+from unittest.mock import patch
 
 import pytest
 
@@ -192,3 +193,13 @@ def test_resolve_attributes_multiple():
 
     assert len(result["resolved"]) >= 0
     assert len(result["errors"]) >= 0
+
+
+def test_resolve_attributes_exact_name_skips_normalized_scan():
+    """Checks that exact attribute names resolve without scanning the whole cache."""
+    TemplateAttributeParser.preload()
+    with patch("tekla_mcp_server.tekla.template_attrs_parser.find_normalized_match") as normalized_match:
+        result = TemplateAttributeParser.resolve_attributes(["WEIGHT", "LENGTH"])
+
+    assert result == {"resolved": ["WEIGHT", "LENGTH"], "errors": []}
+    normalized_match.assert_not_called()
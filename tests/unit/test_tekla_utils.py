@@ -34,14 +34,13 @@ def cleanup():
 
 def mock_beam(x, y, z, name="TEST_WALL"):
     """Helper for mocking beams."""
-    beam = Beam()
+    # The (start, end) constructor sets both points in one interop call
+    beam = Beam(Point(x, y, z), Point(x + 2000, y, z))
     beam.Profile.ProfileString = "3000*200"
     beam.Material.MaterialString = "Concrete_Undefined"
     beam.Class = "1"
     beam.Name = name
     beam.Position.Depth = Position.DepthEnum.FRONT
-    beam.StartPoint = Point(x, y, z)
-    beam.EndPoint = Point(x + 2000, y, z)
     beam.Insert()
     created_elements.append(beam)
     return beam